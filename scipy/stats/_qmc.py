@@ -7,7 +7,7 @@ import numbers
 import os
 import warnings
 from abc import ABC, abstractmethod
-from functools import partial
+from functools import lru_cache, partial
 from typing import (
     Callable,
     ClassVar,
@@ -24,13 +24,12 @@ if TYPE_CHECKING:
         DecimalNumber, GeneratorType, IntNumber, SeedType
     )
 
-import scipy.stats as stats
 from scipy._lib._util import rng_integers, _rng_spawn
 from scipy.spatial import distance, Voronoi
-from scipy.special import gammainc
+from scipy.special import gammainc, ndtri
 from ._sobol import (
     _initialize_v, _cscramble, _fill_p_cumulative, _draw, _fast_forward,
-    _categorize, _MAXDIM
+    _MAXDIM
 )
 from ._qmc_cy import (
     _cy_wrapper_centered_discrepancy,
@@ -38,8 +37,11 @@ from ._qmc_cy import (
     _cy_wrapper_mixture_discrepancy,
     _cy_wrapper_l2_star_discrepancy,
     _cy_wrapper_update_discrepancy,
+    _cy_wrapper_perturb_discrepancy,
     _cy_van_der_corput_scrambled,
     _cy_van_der_corput,
+    _cy_halton_scrambled,
+    _cy_halton,
 )
 
 
@@ -76,10 +78,12 @@ def check_random_state(seed=None):
         Random number generator.
 
     """
-    if seed is None or isinstance(seed, (numbers.Integral, np.integer)):
-        return np.random.default_rng(seed)
-    elif isinstance(seed, (np.random.RandomState, np.random.Generator)):
+    # cheapest checks first: ``numbers.Integral`` is an ABC and
+    # ``isinstance`` against it is slow
+    if isinstance(seed, (np.random.Generator, np.random.RandomState)):
         return seed
+    elif seed is None or isinstance(seed, (numbers.Integral, np.integer)):
+        return np.random.default_rng(seed)
     else:
         raise ValueError(f'{seed!r} cannot be used to seed a'
                          ' numpy.random.Generator instance')
@@ -159,13 +163,28 @@ def scale(
         if (sample.max() > 1.) or (sample.min() < 0.):
             raise ValueError('Sample is not in unit hypercube')
 
-        return sample * (upper - lower) + lower
+        # operate in place on the result to not allocate temporaries
+        sample_scaled = np.multiply(sample, upper - lower)
+        sample_scaled += lower
+        return sample_scaled
     else:
         # Checking that sample is within the bounds
         if not (np.all(sample >= lower) and np.all(sample <= upper)):
             raise ValueError('Sample is out of bounds')
 
-        return (sample - lower) / (upper - lower)
+        # same dtype as a true division
+        dtype = np.result_type(sample, lower, upper, 1.)
+        sample_scaled = np.subtract(sample, lower, dtype=dtype)
+        sample_scaled /= upper - lower
+        return sample_scaled
+
+
+_DISCREPANCY_METHODS = {
+    "CD": _cy_wrapper_centered_discrepancy,
+    "WD": _cy_wrapper_wrap_around_discrepancy,
+    "MD": _cy_wrapper_mixture_discrepancy,
+    "L2-star": _cy_wrapper_l2_star_discrepancy,
+}
 
 
 def discrepancy(
@@ -292,18 +311,13 @@ def discrepancy(
 
     workers = _validate_workers(workers)
 
-    methods = {
-        "CD": _cy_wrapper_centered_discrepancy,
-        "WD": _cy_wrapper_wrap_around_discrepancy,
-        "MD": _cy_wrapper_mixture_discrepancy,
-        "L2-star": _cy_wrapper_l2_star_discrepancy,
-    }
-
-    if method in methods:
-        return methods[method](sample, iterative, workers=workers)
-    else:
+    try:
+        disc_func = _DISCREPANCY_METHODS[method]
+    except KeyError as exc:
         raise ValueError(f"{method!r} is not a valid method. It must be one of"
-                         f" {set(methods)!r}")
+                         f" {set(_DISCREPANCY_METHODS)!r}") from exc
+
+    return disc_func(sample, iterative, workers=workers)
 
 
 def update_discrepancy(
@@ -400,61 +414,8 @@ def _perturb_discrepancy(sample: np.ndarray, i1: int, i2: int, k: int,
        Inference, 2005.
 
     """
-    n = sample.shape[0]
-
-    z_ij = sample - 0.5
-
-    # Eq (19)
-    c_i1j = (1. / n ** 2.
-             * np.prod(0.5 * (2. + abs(z_ij[i1, :])
-                              + abs(z_ij) - abs(z_ij[i1, :] - z_ij)), axis=1))
-    c_i2j = (1. / n ** 2.
-             * np.prod(0.5 * (2. + abs(z_ij[i2, :])
-                              + abs(z_ij) - abs(z_ij[i2, :] - z_ij)), axis=1))
-
-    # Eq (20)
-    c_i1i1 = (1. / n ** 2 * np.prod(1 + abs(z_ij[i1, :]))
-              - 2. / n * np.prod(1. + 0.5 * abs(z_ij[i1, :])
-                                 - 0.5 * z_ij[i1, :] ** 2))
-    c_i2i2 = (1. / n ** 2 * np.prod(1 + abs(z_ij[i2, :]))
-              - 2. / n * np.prod(1. + 0.5 * abs(z_ij[i2, :])
-                                 - 0.5 * z_ij[i2, :] ** 2))
-
-    # Eq (22), typo in the article in the denominator i2 -> i1
-    num = (2 + abs(z_ij[i2, k]) + abs(z_ij[:, k])
-           - abs(z_ij[i2, k] - z_ij[:, k]))
-    denum = (2 + abs(z_ij[i1, k]) + abs(z_ij[:, k])
-             - abs(z_ij[i1, k] - z_ij[:, k]))
-    gamma = num / denum
-
-    # Eq (23)
-    c_p_i1j = gamma * c_i1j
-    # Eq (24)
-    c_p_i2j = c_i2j / gamma
-
-    alpha = (1 + abs(z_ij[i2, k])) / (1 + abs(z_ij[i1, k]))
-    beta = (2 - abs(z_ij[i2, k])) / (2 - abs(z_ij[i1, k]))
-
-    g_i1 = np.prod(1. + abs(z_ij[i1, :]))
-    g_i2 = np.prod(1. + abs(z_ij[i2, :]))
-    h_i1 = np.prod(1. + 0.5 * abs(z_ij[i1, :]) - 0.5 * (z_ij[i1, :] ** 2))
-    h_i2 = np.prod(1. + 0.5 * abs(z_ij[i2, :]) - 0.5 * (z_ij[i2, :] ** 2))
-
-    # Eq (25), typo in the article g is missing
-    c_p_i1i1 = ((g_i1 * alpha) / (n ** 2) - 2. * alpha * beta * h_i1 / n)
-    # Eq (26), typo in the article n ** 2
-    c_p_i2i2 = ((g_i2 / ((n ** 2) * alpha)) - (2. * h_i2 / (n * alpha * beta)))
-
-    # Eq (26)
-    sum_ = c_p_i1j - c_i1j + c_p_i2j - c_i2j
-
-    mask = np.ones(n, dtype=bool)
-    mask[[i1, i2]] = False
-    sum_ = sum(sum_[mask])
-
-    disc_ep = (disc + c_p_i1i1 - c_i1i1 + c_p_i2i2 - c_i2i2 + 2 * sum_)
-
-    return disc_ep
+    sample = np.asarray(sample, dtype=np.float64, order="C")
+    return _cy_wrapper_perturb_discrepancy(sample, i1, i2, k, disc)
 
 
 def primes_from_2_to(n: int) -> np.ndarray:
@@ -489,6 +450,24 @@ def primes_from_2_to(n: int) -> np.ndarray:
     return np.r_[2, 3, ((3 * np.nonzero(sieve)[0][1:] + 1) | 1)]
 
 
+# All the primes below 1000
+_SMALL_PRIMES = (
+    2, 3, 5, 7, 11, 13, 17, 19, 23, 29, 31, 37, 41, 43, 47, 53, 59,
+    61, 67, 71, 73, 79, 83, 89, 97, 101, 103, 107, 109, 113, 127,
+    131, 137, 139, 149, 151, 157, 163, 167, 173, 179, 181, 191, 193,
+    197, 199, 211, 223, 227, 229, 233, 239, 241, 251, 257, 263, 269,
+    271, 277, 281, 283, 293, 307, 311, 313, 317, 331, 337, 347, 349,
+    353, 359, 367, 373, 379, 383, 389, 397, 401, 409, 419, 421, 431,
+    433, 439, 443, 449, 457, 461, 463, 467, 479, 487, 491, 499, 503,
+    509, 521, 523, 541, 547, 557, 563, 569, 571, 577, 587, 593, 599,
+    601, 607, 613, 617, 619, 631, 641, 643, 647, 653, 659, 661, 673,
+    677, 683, 691, 701, 709, 719, 727, 733, 739, 743, 751, 757, 761,
+    769, 773, 787, 797, 809, 811, 821, 823, 827, 829, 839, 853, 857,
+    859, 863, 877, 881, 883, 887, 907, 911, 919, 929, 937, 941, 947,
+    953, 967, 971, 977, 983, 991, 997
+)
+
+
 def n_primes(n: IntNumber) -> list[int]:
     """List of the n-first prime numbers.
 
@@ -503,29 +482,28 @@ def n_primes(n: IntNumber) -> list[int]:
         List of primes.
 
     """
-    primes = [2, 3, 5, 7, 11, 13, 17, 19, 23, 29, 31, 37, 41, 43, 47, 53, 59,
-              61, 67, 71, 73, 79, 83, 89, 97, 101, 103, 107, 109, 113, 127,
-              131, 137, 139, 149, 151, 157, 163, 167, 173, 179, 181, 191, 193,
-              197, 199, 211, 223, 227, 229, 233, 239, 241, 251, 257, 263, 269,
-              271, 277, 281, 283, 293, 307, 311, 313, 317, 331, 337, 347, 349,
-              353, 359, 367, 373, 379, 383, 389, 397, 401, 409, 419, 421, 431,
-              433, 439, 443, 449, 457, 461, 463, 467, 479, 487, 491, 499, 503,
-              509, 521, 523, 541, 547, 557, 563, 569, 571, 577, 587, 593, 599,
-              601, 607, 613, 617, 619, 631, 641, 643, 647, 653, 659, 661, 673,
-              677, 683, 691, 701, 709, 719, 727, 733, 739, 743, 751, 757, 761,
-              769, 773, 787, 797, 809, 811, 821, 823, 827, 829, 839, 853, 857,
-              859, 863, 877, 881, 883, 887, 907, 911, 919, 929, 937, 941, 947,
-              953, 967, 971, 977, 983, 991, 997][:n]  # type: ignore[misc]
-
-    if len(primes) < n:
-        big_number = 2000
-        while 'Not enough primes':
-            primes = primes_from_2_to(big_number)[:n]  # type: ignore
-            if len(primes) == n:
-                break
-            big_number += 1000
-
-    return primes
+    if n <= len(_SMALL_PRIMES):
+        return list(_SMALL_PRIMES[:n])
+
+    return list(_n_primes_sieve(n))
+
+
+@lru_cache(maxsize=4)
+def _n_primes_sieve(n: IntNumber) -> tuple[int, ...]:
+    """The n-first prime numbers, computed by sieving and cached.
+
+    Only the last few sizes are kept: each entry holds all its primes.
+    """
+    # Rosser's theorem bounds the n-th prime by n (ln(n) + ln(ln(n))) for
+    # n >= 6: a single sieve up to this bound is enough.
+    big_number = math.ceil(n * (math.log(n) + math.log(math.log(n)))) + 1
+    while 'Not enough primes':
+        primes = primes_from_2_to(big_number)[:n]
+        if len(primes) == n:
+            break
+        big_number += 1000
+
+    return tuple(primes.tolist())
 
 
 def _van_der_corput_permutations(
@@ -560,12 +538,24 @@ def _van_der_corput_permutations(
     rng = check_random_state(random_state)
     count = math.ceil(54 / math.log2(base)) - 1
     permutations = np.repeat(np.arange(base)[None], count, axis=0)
-    for perm in permutations:
-        rng.shuffle(perm)
+    _shuffle_rows(permutations, rng)
 
     return permutations
 
 
+def _shuffle_rows(x: np.ndarray, rng: GeneratorType) -> None:
+    """Shuffle independently, in place, each row of a 2D array.
+
+    With a ``Generator``, all rows are shuffled by a single call. The
+    random stream is consumed as with one ``shuffle`` per row.
+    """
+    if isinstance(rng, np.random.Generator):
+        rng.permuted(x, axis=1, out=x)
+    else:
+        for row in x:
+            rng.shuffle(row)
+
+
 def van_der_corput(
         n: IntNumber,
         base: IntNumber = 2,
@@ -761,10 +751,10 @@ class QMCEngine(ABC):
         self.num_generated = 0
 
         config = {
-            # random-cd
+            # random-cd, the generator is given at each call: `reset`
+            # replaces ``self.rng``
             "n_nochange": 100,
             "n_iters": 10_000,
-            "rng": self.rng,
 
             # lloyd
             "tol": 1e-5,
@@ -803,7 +793,7 @@ class QMCEngine(ABC):
         """
         sample = self._random(n, workers=workers)
         if self.optimization_method is not None:
-            sample = self.optimization_method(sample)
+            sample = self.optimization_method(sample, rng=self.rng)
 
         self.num_generated += n
         return sample
@@ -1030,6 +1020,8 @@ class Halton(QMCEngine):
 
         # important to have ``type(bdim) == int`` for performance reason
         self.base = [int(bdim) for bdim in n_primes(d)]
+        # C ``long`` as expected by the compiled kernels
+        self._bases = np.asarray(self.base, dtype=np.dtype("l"))
         self.scramble = scramble
 
         self._initialize_permutations()
@@ -1037,16 +1029,26 @@ class Halton(QMCEngine):
     def _initialize_permutations(self) -> None:
         """Initialize permutations for all Van der Corput sequences.
 
-        Permutations are only needed for scrambling.
+        Permutations are only needed for scrambling. The tables of all
+        dimensions are flattened into a single array, the table of
+        dimension ``i`` spanning ``offsets[i]:offsets[i+1]``.
         """
-        self._permutations: list = [None] * len(self.base)
-        if self.scramble:
-            for i, bdim in enumerate(self.base):
-                permutations = _van_der_corput_permutations(
-                    base=bdim, random_state=self.rng
-                )
-
-                self._permutations[i] = permutations
+        # empty tables without scrambling or without any dimension
+        self._permutations: np.ndarray = np.empty(0, dtype=np.dtype("l"))
+        self._permutations_offsets: np.ndarray = np.zeros(
+            len(self.base) + 1, dtype=np.intp
+        )
+        if self.scramble and len(self.base) > 0:
+            permutations = [
+                _van_der_corput_permutations(base=bdim, random_state=self.rng)
+                for bdim in self.base
+            ]
+
+            np.cumsum([perm.size for perm in permutations],
+                      out=self._permutations_offsets[1:])
+            self._permutations = np.concatenate(
+                [perm.ravel() for perm in permutations]
+            ).astype(np.dtype("l"), copy=False)
 
     def _random(
         self, n: IntNumber = 1, *, workers: IntNumber = 1
@@ -1070,13 +1072,13 @@ class Halton(QMCEngine):
         """
         workers = _validate_workers(workers)
         # Generate a sample using a Van der Corput sequence per dimension.
-        sample = [van_der_corput(n, bdim, start_index=self.num_generated,
-                                 scramble=self.scramble,
-                                 permutations=self._permutations[i],
-                                 workers=workers)
-                  for i, bdim in enumerate(self.base)]
-
-        return np.array(sample).T.reshape(n, self.d)
+        # All dimensions are computed by a single call.
+        if self.scramble:
+            return _cy_halton_scrambled(
+                n, self._bases, self.num_generated, self._permutations,
+                self._permutations_offsets, workers
+            )
+        return _cy_halton(n, self._bases, self.num_generated, workers)
 
 
 class LatinHypercube(QMCEngine):
@@ -1276,8 +1278,9 @@ class LatinHypercube(QMCEngine):
         super().__init__(d=d, seed=seed, optimization=optimization)
         self.scramble = scramble
 
+        # scrambling is fixed at construction: pick the matching LHS
         lhs_method_strength = {
-            1: self._random_lhs,
+            1: self._random_lhs if scramble else self._random_lhs_centered,
             2: self._random_oa_lhs
         }
 
@@ -1296,20 +1299,27 @@ class LatinHypercube(QMCEngine):
 
     def _random_lhs(self, n: IntNumber = 1) -> np.ndarray:
         """Base LHS algorithm."""
-        if not self.scramble:
-            samples: np.ndarray | float = 0.5
-        else:
-            samples = self.rng.uniform(size=(n, self.d))
+        samples = self.rng.uniform(size=(n, self.d))
+        perms = self._lhs_permutations(n)
 
-        perms = np.tile(np.arange(1, n + 1),
-                        (self.d, 1))  # type: ignore[arg-type]
-        for i in range(self.d):
-            self.rng.shuffle(perms[i, :])
-        perms = perms.T
+        # the output is the array of uniform draws, updated in place
+        np.subtract(perms, samples, out=samples)
+        samples /= n
+        return samples
 
-        samples = (perms - samples) / n
+    def _random_lhs_centered(self, n: IntNumber = 1) -> np.ndarray:
+        """Base LHS algorithm, points are at the center of the cells."""
+        samples = self._lhs_permutations(n) - 0.5
+        samples /= n
         return samples
 
+    def _lhs_permutations(self, n: IntNumber) -> np.ndarray:
+        """Random permutation of the cells ``1..n`` for each dimension."""
+        perms = np.tile(np.arange(1, n + 1),
+                        (self.d, 1))  # type: ignore[arg-type]
+        _shuffle_rows(perms, self.rng)
+        return perms.T
+
     def _random_oa_lhs(self, n: IntNumber = 4) -> np.ndarray:
         """Orthogonal array based LHS of strength 2."""
         p = np.sqrt(n).astype(int)
@@ -1335,29 +1345,61 @@ class LatinHypercube(QMCEngine):
             oa_sample[:, 2+p_-1] = np.mod(oa_sample[:, 0]
                                           + p_*oa_sample[:, 1], p)
 
-        # scramble the OA
-        oa_sample_ = np.empty(shape=(n_row, n_col), dtype=int)
-        for j in range(n_col):
-            perms = self.rng.permutation(p)
-            oa_sample_[:, j] = perms[oa_sample[:, j]]
+        # The permutations to scramble the OA are drawn, but the OA-LHS below
+        # is built from the unscrambled OA: only the draws are kept, so that
+        # the random stream is the same.
+        perms = np.tile(np.arange(p), (n_col, 1))
+        _shuffle_rows(perms, self.rng)
 
         # following is making a scrambled OA into an OA-LHS
-        oa_lhs_sample = np.zeros(shape=(n_row, n_col))
+        # The engine is reset before each draw, so the same 1D LHS of size p
+        # is added to the subarray of every symbol of every column.
         lhs_engine = LatinHypercube(d=1, scramble=self.scramble, strength=1,
                                     seed=self.rng)  # type: QMCEngine
-        for j in range(n_col):
-            for k in range(p):
-                idx = oa_sample[:, j] == k
-                lhs = lhs_engine.random(p).flatten()
-                oa_lhs_sample[:, j][idx] = lhs + oa_sample[:, j][idx]
-
-                lhs_engine = lhs_engine.reset()
+        lhs = lhs_engine.random(p).flatten()
+
+        # Each symbol appears p times per column. After a stable sort, rows
+        # are grouped by symbol in order of appearance, and the LHS is added
+        # to each group at once by broadcasting over the (symbol, row) axes.
+        order = np.argsort(oa_sample, axis=0, kind='stable')
+        oa_lhs = np.take_along_axis(oa_sample, order, axis=0)
+        oa_lhs = (oa_lhs.reshape(p, p, n_col)
+                  + lhs[np.newaxis, :, np.newaxis]).reshape(n_row, n_col)
+        oa_lhs_sample = np.empty(shape=(n_row, n_col))
+        np.put_along_axis(oa_lhs_sample, order, oa_lhs, axis=0)
 
         oa_lhs_sample /= p
 
         return oa_lhs_sample[:, :self.d]  # type: ignore
 
 
+# number of dimensions whose scrambling matrices are drawn at once
+_SCRAMBLE_BLOCK_SIZE = 256
+
+# positions of the bits of the integer types used by `Sobol`
+_SOBOL_BIT_POSITIONS: dict[type, np.ndarray] = {
+    np.uint32: np.arange(32, dtype=np.uint32),
+    np.uint64: np.arange(64, dtype=np.uint64),
+}
+
+
+# direction numbers are cached up to this dimension: 512 KiB per table
+_SOBOL_CACHE_MAXDIM = 1024
+
+
+@lru_cache(maxsize=4)
+def _sobol_direction_numbers(d: int, bits: int, dtype_i: type) -> np.ndarray:
+    """Direction numbers of the first `d` dimensions of Sobol'.
+
+    The result is cached and read-only: engines of the same dimension
+    are often constructed repeatedly, e.g. by `MultivariateNormalQMC`.
+    """
+    sv: np.ndarray = np.zeros((d, bits), dtype=dtype_i)
+    _initialize_v(sv, dim=d, bits=bits)
+    sv.flags.writeable = False
+    return sv
+
+
 class Sobol(QMCEngine):
     """Engine for generating (scrambled) Sobol' sequences.
 
@@ -1529,9 +1571,16 @@ class Sobol(QMCEngine):
 
         self.maxn = 2**self.bits
 
-        # v is d x maxbit matrix
-        self._sv: np.ndarray = np.zeros((d, self.bits), dtype=self.dtype_i)
-        _initialize_v(self._sv, dim=d, bits=self.bits)
+        # v is d x maxbit matrix. The matrices of small dimensions are
+        # cached, and copied as scrambling modifies them.
+        self._sv: np.ndarray
+        if d <= _SOBOL_CACHE_MAXDIM:
+            self._sv = _sobol_direction_numbers(
+                int(d), int(self.bits), self.dtype_i
+            ).copy()
+        else:
+            self._sv = np.zeros((d, self.bits), dtype=self.dtype_i)
+            _initialize_v(self._sv, dim=d, bits=self.bits)
 
         if not scramble:
             self._shift: np.ndarray = np.zeros(d, dtype=self.dtype_i)
@@ -1542,29 +1591,36 @@ class Sobol(QMCEngine):
         self._quasi = self._shift.copy()
 
         # normalization constant with the largest possible number
-        # calculate in Python to not overflow int with 2**64
-        self._scale = 1.0 / 2 ** self.bits
+        # exact power of 2, computed without the integer 2**64
+        self._scale = math.ldexp(1.0, -int(self.bits))
 
         self._first_point = (self._quasi * self._scale).reshape(1, -1)
-        # explicit casting to float64
-        self._first_point = self._first_point.astype(np.float64)
+        # explicit casting to float64, the product already is one
+        self._first_point = self._first_point.astype(np.float64, copy=False)
 
     def _scramble(self) -> None:
         """Scramble the sequence using LMS+shift."""
-        # Generate shift vector
-        self._shift = np.dot(
-            rng_integers(self.rng, 2, size=(self.d, self.bits),
-                         dtype=self.dtype_i),
-            2 ** np.arange(self.bits, dtype=self.dtype_i),
-        )
-        # Generate lower triangular matrices (stacked across dimensions)
-        ltm = np.tril(rng_integers(self.rng, 2,
-                                   size=(self.d, self.bits, self.bits),
-                                   dtype=self.dtype_i))
-        _cscramble(
-            dim=self.d, bits=self.bits,  # type: ignore[arg-type]
-            ltm=ltm, sv=self._sv
-        )
+        # Generate shift vector: the random bits are packed with shifts,
+        # integer dot products do not go through BLAS
+        shift_bits = rng_integers(self.rng, 2, size=(self.d, self.bits),
+                                  dtype=self.dtype_i)
+        shift_bits <<= _SOBOL_BIT_POSITIONS[self.dtype_i][:self.bits]
+        self._shift = np.bitwise_or.reduce(shift_bits, axis=1)
+        # Generate lower triangular matrices (stacked across dimensions).
+        # They are drawn and applied by blocks of dimensions to bound the
+        # memory: the matrices of all dimensions take ``d * bits**2``
+        # integers. Draws of these integer types are not buffered, so the
+        # random stream is the same as with a single draw.
+        for start in range(0, self.d, _SCRAMBLE_BLOCK_SIZE):
+            stop = min(start + _SCRAMBLE_BLOCK_SIZE, self.d)
+            ltm = np.tril(rng_integers(self.rng, 2,
+                                       size=(stop - start, self.bits,
+                                             self.bits),
+                                       dtype=self.dtype_i))
+            _cscramble(
+                dim=stop - start, bits=self.bits,  # type: ignore[arg-type]
+                ltm=ltm, sv=self._sv[start:stop]
+            )
 
     def _random(
         self, n: IntNumber = 1, *, workers: IntNumber = 1
@@ -1604,17 +1660,15 @@ class Sobol(QMCEngine):
                 warnings.warn("The balance properties of Sobol' points require"
                               " n to be a power of 2.", stacklevel=2)
 
-            if n == 1:
-                sample = self._first_point
-            else:
+            # the first point is written in place, the next points are
+            # drawn directly after it: no concatenation is needed
+            sample[0] = self._first_point[0]
+            if n > 1:
                 _draw(
                     n=n - 1, num_gen=self.num_generated, dim=self.d,
                     scale=self._scale, sv=self._sv, quasi=self._quasi,
-                    sample=sample
+                    sample=sample[1:]
                 )
-                sample = np.concatenate(
-                    [self._first_point, sample]
-                )[:n]  # type: ignore[misc]
         else:
             _draw(
                 n=n, num_gen=self.num_generated - 1, dim=self.d,
@@ -2162,18 +2216,27 @@ class MultivariateNormalQMC:
         if self._inv_transform:
             # apply inverse transform
             # (values to close to 0/1 result in inf values)
-            return stats.norm.ppf(0.5 + (1 - 1e-10) * (samples - 0.5))  # type: ignore[attr-defined]
+            # The standard normal quantile function is applied in place.
+            samples -= 0.5
+            samples *= 1 - 1e-10
+            samples += 0.5
+            return ndtri(samples, out=samples)
         else:
             # apply Box-Muller transform (note: indexes starting from 1)
-            even = np.arange(0, samples.shape[-1], 2)
-            Rs = np.sqrt(-2 * np.log(samples[:, even]))
-            thetas = 2 * math.pi * samples[:, 1 + even]
-            cos = np.cos(thetas)
-            sin = np.sin(thetas)
-            transf_samples = np.stack([Rs * cos, Rs * sin],
-                                      -1).reshape(n, -1)
+            # The pairs (R cos(theta), R sin(theta)) overwrite the pairs of
+            # uniforms they are computed from.
+            u_even = samples[:, ::2]
+            u_odd = samples[:, 1::2]
+            Rs = np.log(u_even)
+            Rs *= -2
+            np.sqrt(Rs, out=Rs)
+            thetas = 2 * math.pi * u_odd
+            np.cos(thetas, out=u_even)
+            u_even *= Rs
+            np.sin(thetas, out=u_odd)
+            u_odd *= Rs
             # make sure we only return the number of dimension requested
-            return transf_samples[:, : self._d]
+            return samples[:, : self._d]
 
 
 class MultinomialQMC:
@@ -2231,6 +2294,9 @@ class MultinomialQMC:
             raise ValueError('Elements of pvals must be non-negative.')
         if not np.isclose(np.sum(pvals), 1):
             raise ValueError('Elements of pvals must sum to 1.')
+        self._p_cumulative = np.empty_like(self.pvals, dtype=float)
+        _fill_p_cumulative(np.array(self.pvals, dtype=float),
+                           self._p_cumulative)
         self.n_trials = n_trials
         if engine is None:
             self.engine = Sobol(
@@ -2258,15 +2324,22 @@ class MultinomialQMC:
             Sample.
 
         """
-        sample = np.empty((n, len(self.pvals)))
+        n_pvals = len(self.pvals)
+        base_draws = np.empty((n, self.n_trials))
         for i in range(n):
-            base_draws = self.engine.random(self.n_trials).ravel()
-            p_cumulative = np.empty_like(self.pvals, dtype=float)
-            _fill_p_cumulative(np.array(self.pvals, dtype=float), p_cumulative)
-            sample_ = np.zeros_like(self.pvals, dtype=int)
-            _categorize(base_draws, p_cumulative, sample_)
-            sample[i] = sample_
-        return sample
+            base_draws[i] = self.engine.random(self.n_trials).ravel()
+
+        # Categorize all the draws at once: index of the first cumulative
+        # probability not below the draw, the draws being compared in single
+        # precision like the cumulative probabilities are computed.
+        idx = np.searchsorted(self._p_cumulative,
+                              base_draws.astype(np.float32))
+        np.minimum(idx, n_pvals - 1, out=idx)
+
+        # count the categories of each sample with a single bincount
+        idx += n_pvals * np.arange(n)[:, np.newaxis]
+        sample = np.bincount(idx.ravel(), minlength=n * n_pvals)
+        return sample.reshape(n, n_pvals).astype(np.float64)
 
 
 def _select_optimizer(
@@ -2323,6 +2396,8 @@ def _random_cd(
         # discrepancy measures are invariant under permuting factors and runs
         return best_sample
 
+    # the compiled perturbation kernel works on a C-contiguous array
+    best_sample = np.ascontiguousarray(best_sample, dtype=np.float64)
     best_disc = discrepancy(best_sample)
 
     bounds = ([0, d - 1],
@@ -2337,9 +2412,11 @@ def _random_cd(
         col = rng_integers(rng, *bounds[0], endpoint=True)  # type: ignore[misc]
         row_1 = rng_integers(rng, *bounds[1], endpoint=True)  # type: ignore[misc]
         row_2 = rng_integers(rng, *bounds[2], endpoint=True)  # type: ignore[misc]
-        disc = _perturb_discrepancy(best_sample,
-                                    row_1, row_2, col,
-                                    best_disc)
+        # ``best_sample`` is already a C-contiguous float64 array: the
+        # compiled kernel is called directly, without conversion
+        disc = _cy_wrapper_perturb_discrepancy(best_sample,
+                                               row_1, row_2, col,
+                                               best_disc)
         if disc < best_disc:
             best_sample[row_1, col], best_sample[row_2, col] = (
                 best_sample[row_2, col], best_sample[row_1, col])
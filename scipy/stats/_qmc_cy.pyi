@@ -37,6 +37,15 @@ def _cy_wrapper_update_discrepancy(
 ) -> float: ...
 
 
+def _cy_wrapper_perturb_discrepancy(
+        sample_view: np.ndarray,
+        i1: IntNumber,
+        i2: IntNumber,
+        k: IntNumber,
+        disc: DecimalNumber,
+) -> float: ...
+
+
 def _cy_van_der_corput(
         n: IntNumber,
         base: IntNumber,
@@ -52,3 +61,21 @@ def _cy_van_der_corput_scrambled(
         permutations: np.ndarray,
         workers: IntNumber,
 ) -> np.ndarray: ...
+
+
+def _cy_halton(
+        n: IntNumber,
+        bases: np.ndarray,
+        start_index: IntNumber,
+        workers: IntNumber,
+) -> np.ndarray: ...
+
+
+def _cy_halton_scrambled(
+        n: IntNumber,
+        bases: np.ndarray,
+        start_index: IntNumber,
+        permutations: np.ndarray,
+        offsets: np.ndarray,
+        workers: IntNumber,
+) -> np.ndarray: ...
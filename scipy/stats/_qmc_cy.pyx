@@ -8,7 +8,8 @@
 
 import numpy as np
 cimport numpy as np
-from libc.math cimport fabs, sqrt, pow
+from libc.math cimport fabs, sqrt, pow, ldexp
+from libc.stdint cimport int64_t
 
 np.import_array()
 
@@ -22,13 +23,10 @@ cdef extern from "<thread>" namespace "std" nogil:
         # threaded loops take less arguments, we need to find a workaround
         # to pass 7 arguments to the functions. Here we use `_`.
         void thread[A, B, C, D, E, F, G](A, B, C, D, E, F, G)
+        # `_cy_halton_scrambled_loop` also needs the permutation offsets.
+        void thread[A, B, C, D, E, F, G, H](A, B, C, D, E, F, G, H)
         void join()
 
-cdef extern from "<mutex>" namespace "std" nogil:
-    cdef cppclass mutex:
-        void lock()
-        void unlock()
-
 cdef extern from "<functional>" namespace "std" nogil:
     cdef cppclass reference_wrapper[T]:
         pass
@@ -37,11 +35,14 @@ cdef extern from "<functional>" namespace "std" nogil:
 from libcpp.vector cimport vector
 
 
-cdef mutex threaded_sum_mutex
+# number of rows processed together in the cache-blocked pair loops
+cdef Py_ssize_t PAIR_BLOCK_SIZE = 256
+
 
 def _cy_wrapper_centered_discrepancy(double[:, ::1] sample, bint iterative,
                                      workers):
-    return centered_discrepancy(sample, iterative, workers)
+    return centered_discrepancy(sample, _abs_centered(sample), iterative,
+                                workers)
 
 
 def _cy_wrapper_wrap_around_discrepancy(double[:, ::1] sample,
@@ -51,7 +52,8 @@ def _cy_wrapper_wrap_around_discrepancy(double[:, ::1] sample,
 
 def _cy_wrapper_mixture_discrepancy(double[:, ::1] sample,
                                     bint iterative, workers):
-    return mixture_discrepancy(sample, iterative, workers)
+    return mixture_discrepancy(sample, _abs_centered(sample), iterative,
+                               workers)
 
 
 def _cy_wrapper_l2_star_discrepancy(double[:, ::1] sample,
@@ -59,25 +61,32 @@ def _cy_wrapper_l2_star_discrepancy(double[:, ::1] sample,
     return l2_star_discrepancy(sample, iterative, workers)
 
 
+cdef double[:, ::1] _abs_centered(double[:, ::1] sample):
+    # ``|x - 0.5|`` is used by both sums of the CD and MD: it is computed
+    # once instead of in the innermost loop of every pair of points.
+    abs_ = np.subtract(sample, 0.5)
+    np.abs(abs_, out=abs_)
+    return abs_
+
+
 cdef double centered_discrepancy(double[:, ::1] sample_view,
+                                 double[:, ::1] abs_view,
                                  bint iterative, unsigned int workers) noexcept nogil:
     cdef:
         Py_ssize_t n = sample_view.shape[0]
         Py_ssize_t d = sample_view.shape[1]
         Py_ssize_t i = 0, j = 0
-        double prod, disc1 = 0
+        double prod, abs_, disc1 = 0
 
     for i in range(n):
         prod = 1
         for j in range(d):
-            prod *= (
-                1 + 0.5 * fabs(sample_view[i, j] - 0.5) - 0.5
-                * fabs(sample_view[i, j] - 0.5) ** 2
-            )
+            abs_ = abs_view[i, j]
+            prod *= 1 + 0.5 * abs_ - 0.5 * abs_ * abs_
         disc1 += prod
 
     cdef double disc2 = threaded_loops(centered_discrepancy_loop, sample_view,
-                                       workers)
+                                       abs_view, workers)
 
     if iterative:
         n += 1
@@ -87,22 +96,32 @@ cdef double centered_discrepancy(double[:, ::1] sample_view,
 
 
 cdef double centered_discrepancy_loop(double[:, ::1] sample_view,
+                                      double[:, ::1] abs_view,
                                       Py_ssize_t istart, Py_ssize_t istop) noexcept nogil:
 
     cdef:
         Py_ssize_t i, j, k
-        double prod, disc2 = 0
+        double prod, disc2 = 0, tmp_sum
 
+    # The pair term is symmetric: only ``j > i`` is visited and counted
+    # twice. On the diagonal, the term reduces to ``prod(1 + |x - 0.5|)``.
     for i in range(istart, istop):
-        for j in range(sample_view.shape[0]):
+        prod = 1
+        for k in range(sample_view.shape[1]):
+            prod *= 1 + abs_view[i, k]
+        disc2 += prod
+
+        tmp_sum = 0
+        for j in range(i + 1, sample_view.shape[0]):
             prod = 1
             for k in range(sample_view.shape[1]):
                 prod *= (
-                    1 + 0.5 * fabs(sample_view[i, k] - 0.5)
-                    + 0.5 * fabs(sample_view[j, k] - 0.5)
+                    1 + 0.5 * abs_view[i, k]
+                    + 0.5 * abs_view[j, k]
                     - 0.5 * fabs(sample_view[i, k] - sample_view[j, k])
                 )
-            disc2 += prod
+            tmp_sum += prod
+        disc2 += 2 * tmp_sum
 
     return disc2
 
@@ -114,7 +133,8 @@ cdef double wrap_around_discrepancy(double[:, ::1] sample_view,
         Py_ssize_t d = sample_view.shape[1]
         double disc
 
-    disc = threaded_loops(wrap_around_loop, sample_view,
+    # the WD does not use ``|x - 0.5|``
+    disc = threaded_loops(wrap_around_loop, sample_view, sample_view,
                           workers)
 
     if iterative:
@@ -124,41 +144,48 @@ cdef double wrap_around_discrepancy(double[:, ::1] sample_view,
 
 
 cdef double wrap_around_loop(double[:, ::1] sample_view,
+                             double[:, ::1] abs_view,
                              Py_ssize_t istart, Py_ssize_t istop) noexcept nogil:
 
     cdef:
         Py_ssize_t i, j, k
-        double prod, disc = 0
+        double prod, x_kikj, disc = 0, tmp_sum
+        # the pair term of a point with itself
+        double diag = pow(3.0 / 2.0, sample_view.shape[1])
 
+    # The pair term is symmetric: only ``j > i`` is visited and counted
+    # twice.
     for i in range(istart, istop):
-        for j in range(sample_view.shape[0]):
+        tmp_sum = 0
+        for j in range(i + 1, sample_view.shape[0]):
             prod = 1
             for k in range(sample_view.shape[1]):
                 x_kikj = fabs(sample_view[i, k] - sample_view[j, k])
-                prod *= 3.0 / 2.0 - x_kikj + x_kikj ** 2
-            disc += prod
+                prod *= 3.0 / 2.0 - x_kikj + x_kikj * x_kikj
+            tmp_sum += prod
+        disc += diag + 2 * tmp_sum
 
     return disc
 
 
 cdef double mixture_discrepancy(double[:, ::1] sample_view,
+                                double[:, ::1] abs_view,
                                 bint iterative, unsigned int workers) noexcept nogil:
     cdef:
         Py_ssize_t n = sample_view.shape[0]
         Py_ssize_t d = sample_view.shape[1]
         Py_ssize_t i = 0, j = 0
-        double prod = 1, disc = 0, disc1 = 0
+        double prod = 1, abs_, disc = 0, disc1 = 0
 
     for i in range(n):
         for j in range(d):
-            prod *= (
-                5.0 / 3.0 - 0.25 * fabs(sample_view[i, j] - 0.5)
-                - 0.25 * fabs(sample_view[i, j] - 0.5) ** 2
-            )
+            abs_ = abs_view[i, j]
+            prod *= 5.0 / 3.0 - 0.25 * abs_ - 0.25 * abs_ * abs_
         disc1 += prod
         prod = 1
 
-    cdef double disc2 = threaded_loops(mixture_loop, sample_view, workers)
+    cdef double disc2 = threaded_loops(mixture_loop, sample_view, abs_view,
+                                       workers)
 
     if iterative:
         n += 1
@@ -170,25 +197,35 @@ cdef double mixture_discrepancy(double[:, ::1] sample_view,
     return disc - disc1 + disc2
 
 
-cdef double mixture_loop(double[:, ::1] sample_view, Py_ssize_t istart,
+cdef double mixture_loop(double[:, ::1] sample_view,
+                         double[:, ::1] abs_view, Py_ssize_t istart,
                          Py_ssize_t istop) noexcept nogil:
 
     cdef:
         Py_ssize_t i, j, k
-        double prod, disc2 = 0
+        double prod, x_kikj, disc2 = 0, tmp_sum
 
+    # The pair term is symmetric: only ``j > i`` is visited and counted
+    # twice. On the diagonal, the term reduces to
+    # ``prod(15/8 - 0.5 |x - 0.5|)``.
     for i in range(istart, istop):
-        for j in range(sample_view.shape[0]):
+        prod = 1
+        for k in range(sample_view.shape[1]):
+            prod *= 15.0 / 8.0 - 0.5 * abs_view[i, k]
+        disc2 += prod
+
+        tmp_sum = 0
+        for j in range(i + 1, sample_view.shape[0]):
             prod = 1
             for k in range(sample_view.shape[1]):
+                x_kikj = fabs(sample_view[i, k] - sample_view[j, k])
                 prod *= (15.0 / 8.0
-                         - 0.25 * fabs(sample_view[i, k] - 0.5)
-                         - 0.25 * fabs(sample_view[j, k] - 0.5)
-                         - 3.0 / 4.0 * fabs(sample_view[i, k]
-                                            - sample_view[j, k])
-                         + 0.5
-                         * fabs(sample_view[i, k] - sample_view[j, k]) ** 2)
-            disc2 += prod
+                         - 0.25 * abs_view[i, k]
+                         - 0.25 * abs_view[j, k]
+                         - 3.0 / 4.0 * x_kikj
+                         + 0.5 * x_kikj * x_kikj)
+            tmp_sum += prod
+        disc2 += 2 * tmp_sum
 
     return disc2
 
@@ -208,7 +245,9 @@ cdef double l2_star_discrepancy(double[:, ::1] sample_view,
         disc1 += prod
         prod = 1
 
-    cdef double disc2 = threaded_loops(l2_star_loop, sample_view, workers)
+    # the L2-star does not use ``|x - 0.5|``
+    cdef double disc2 = threaded_loops(l2_star_loop, sample_view, sample_view,
+                                       workers)
 
     if iterative:
         n += 1
@@ -219,24 +258,42 @@ cdef double l2_star_discrepancy(double[:, ::1] sample_view,
     )
 
 
-cdef double l2_star_loop(double[:, ::1] sample_view, Py_ssize_t istart,
+cdef double l2_star_loop(double[:, ::1] sample_view,
+                         double[:, ::1] abs_view, Py_ssize_t istart,
                          Py_ssize_t istop) noexcept nogil:
 
     cdef:
-        Py_ssize_t i, j, k
+        Py_ssize_t n = sample_view.shape[0]
+        Py_ssize_t i, j, k, jstart = 0, jstop
         double prod = 1, disc2 = 0, tmp_sum = 0
 
+    # The pair term is symmetric: only ``j > i`` is visited and counted
+    # twice. On the diagonal, the term reduces to ``prod(1 - x)``.
     for i in range(istart, istop):
-        for j in range(sample_view.shape[0]):
-            prod = 1
-            for k in range(sample_view.shape[1]):
-                prod *= (
-                    1 - max(sample_view[i, k], sample_view[j, k])
-                )
-            tmp_sum += prod
+        prod = 1
+        for k in range(sample_view.shape[1]):
+            prod *= 1 - sample_view[i, k]
+        disc2 += prod
 
-        disc2 += tmp_sum
-        tmp_sum = 0
+    # Visit the ``j`` rows by blocks: a block stays in cache while it is
+    # paired with every ``i`` row of this worker instead of streaming the
+    # whole sample from memory for each ``i``.
+    jstart = istart + 1
+    while jstart < n:
+        jstop = min(jstart + PAIR_BLOCK_SIZE, n)
+        for i in range(istart, min(istop, jstop - 1)):
+            for j in range(max(jstart, i + 1), jstop):
+                prod = 1
+                for k in range(sample_view.shape[1]):
+                    prod *= (
+                        1 - max(sample_view[i, k], sample_view[j, k])
+                    )
+                tmp_sum += prod
+
+            disc2 += 2 * tmp_sum
+            tmp_sum = 0
+
+        jstart = jstop
 
     return disc2
 
@@ -244,19 +301,23 @@ cdef double l2_star_loop(double[:, ::1] sample_view, Py_ssize_t istart,
 def _cy_wrapper_update_discrepancy(double[::1] x_new_view,
                                    double[:, ::1] sample_view,
                                    double initial_disc):
-    return c_update_discrepancy(x_new_view, sample_view, initial_disc)
+    cdef double disc
+    with nogil:
+        disc = c_update_discrepancy(x_new_view, sample_view, initial_disc)
+    return disc
 
 
 cdef double c_update_discrepancy(double[::1] x_new_view,
                                  double[:, ::1] sample_view,
-                                 double initial_disc) noexcept:
+                                 double initial_disc) noexcept nogil:
     cdef:
         Py_ssize_t n = sample_view.shape[0] + 1
         Py_ssize_t d = sample_view.shape[1]
         Py_ssize_t i = 0, j = 0
         double prod = 1
         double  disc1 = 0, disc2 = 0, disc3 = 0
-        double[::1] abs_ = np.empty(d, dtype=np.float64)
+        # C++ buffer: no NumPy array is created for each update
+        vector[double] abs_ = vector[double](d)
 
 
     # derivation from P.T. Roy (@tupui)
@@ -264,7 +325,7 @@ cdef double c_update_discrepancy(double[::1] x_new_view,
         abs_[i] = fabs(x_new_view[i] - 0.5)
         prod *= (
             1 + 0.5 * abs_[i]
-            - 0.5 * pow(abs_[i], 2)
+            - 0.5 * abs_[i] * abs_[i]
         )
 
     disc1 = (- 2 / <double> n) * prod
@@ -290,59 +351,160 @@ cdef double c_update_discrepancy(double[::1] x_new_view,
     return initial_disc + disc1 + disc2 + disc3
 
 
-ctypedef double (*func_type)(double[:, ::1], Py_ssize_t,
+def _cy_wrapper_perturb_discrepancy(double[:, ::1] sample_view,
+                                    Py_ssize_t i1, Py_ssize_t i2,
+                                    Py_ssize_t k, double disc):
+    cdef double new_disc
+    with nogil:
+        new_disc = c_perturb_discrepancy(sample_view, i1, i2, k, disc)
+    return new_disc
+
+
+cdef double c_perturb_discrepancy(double[:, ::1] sample_view,
+                                  Py_ssize_t i1, Py_ssize_t i2,
+                                  Py_ssize_t k, double disc) noexcept nogil:
+    # Equations refer to Jin et al. (2005), see the references of
+    # `scipy.stats._qmc._perturb_discrepancy`. The terms of the two permuted
+    # rows are computed once and cached in `rows`, everything else is
+    # accumulated in scalars. The operations are done in the same order as
+    # in the former NumPy implementation, so that the results are identical.
+    cdef:
+        Py_ssize_t n = sample_view.shape[0]
+        Py_ssize_t d = sample_view.shape[1]
+        Py_ssize_t i, j
+        # centered coordinates of the permuted rows and their absolute
+        # values, in a C++ buffer: no NumPy array is created for each call
+        vector[double] rows = vector[double](4 * d)
+        double* z_r1 = rows.data()
+        double* abs_r1 = z_r1 + d
+        double* z_r2 = z_r1 + 2 * d
+        double* abs_r2 = z_r1 + 3 * d
+        double z_i1, z_i2, z_ij, abs_i1, abs_i2, abs_ij
+        double inv_n2 = 1. / (<double> n * n)
+        double c_i1j, c_i2j, gamma, sum_ = 0
+        double g_i1 = 1, g_i2 = 1, h_i1 = 1, h_i2 = 1
+        double c_i1i1, c_i2i2, c_p_i1i1, c_p_i2i2, alpha, beta
+        double z_i1k = sample_view[i1, k] - 0.5
+        double z_i2k = sample_view[i2, k] - 0.5
+        double abs_i1k = fabs(z_i1k), abs_i2k = fabs(z_i2k)
+
+    # Eq (20), (25) and (26): products over the two permuted rows
+    for j in range(d):
+        z_i1 = sample_view[i1, j] - 0.5
+        z_i2 = sample_view[i2, j] - 0.5
+        abs_i1 = fabs(z_i1)
+        abs_i2 = fabs(z_i2)
+        z_r1[j] = z_i1
+        abs_r1[j] = abs_i1
+        z_r2[j] = z_i2
+        abs_r2[j] = abs_i2
+        g_i1 *= 1 + abs_i1
+        g_i2 *= 1 + abs_i2
+        h_i1 *= 1 + 0.5 * abs_i1 - 0.5 * (z_i1 * z_i1)
+        h_i2 *= 1 + 0.5 * abs_i2 - 0.5 * (z_i2 * z_i2)
+
+    # Eq (19), (22), (23) and (24): contribution of all the other rows
+    for i in range(n):
+        if i == i1 or i == i2:
+            continue
+
+        c_i1j = 1
+        c_i2j = 1
+        for j in range(d):
+            z_ij = sample_view[i, j] - 0.5
+            abs_ij = fabs(z_ij)
+            c_i1j *= 0.5 * (2 + abs_r1[j] + abs_ij - fabs(z_r1[j] - z_ij))
+            c_i2j *= 0.5 * (2 + abs_r2[j] + abs_ij - fabs(z_r2[j] - z_ij))
+        c_i1j = inv_n2 * c_i1j
+        c_i2j = inv_n2 * c_i2j
+
+        z_ij = sample_view[i, k] - 0.5
+        abs_ij = fabs(z_ij)
+        # typo in the article in the denominator i2 -> i1
+        gamma = (
+            (2 + abs_i2k + abs_ij - fabs(z_i2k - z_ij))
+            / (2 + abs_i1k + abs_ij - fabs(z_i1k - z_ij))
+        )
+
+        # Eq (23) and (24)
+        sum_ += gamma * c_i1j - c_i1j + c_i2j / gamma - c_i2j
+
+    c_i1i1 = inv_n2 * g_i1 - 2. / n * h_i1
+    c_i2i2 = inv_n2 * g_i2 - 2. / n * h_i2
+
+    alpha = (1 + abs_i2k) / (1 + abs_i1k)
+    beta = (2 - abs_i2k) / (2 - abs_i1k)
+
+    # typo in the article g is missing
+    c_p_i1i1 = g_i1 * alpha / (<double> n * n) - 2. * alpha * beta * h_i1 / n
+    # typo in the article n ** 2
+    c_p_i2i2 = g_i2 / (<double> n * n * alpha) - 2. * h_i2 / (n * alpha * beta)
+
+    return disc + c_p_i1i1 - c_i1i1 + c_p_i2i2 - c_i2i2 + 2 * sum_
+
+
+ctypedef double (*func_type)(double[:, ::1], double[:, ::1], Py_ssize_t,
                              Py_ssize_t) noexcept nogil
 
 
 cdef double threaded_loops(func_type loop_func,
                            double[:, ::1] sample_view,
+                           double[:, ::1] abs_view,
                            unsigned int workers) noexcept nogil:
     cdef:
         Py_ssize_t n = sample_view.shape[0]
         double disc2 = 0
 
     if workers <= 1:
-        return loop_func(sample_view, 0, n)
+        return loop_func(sample_view, abs_view, 0, n)
 
     cdef:
         vector[thread] threads
+        # one partial sum per thread: no lock is needed and the reduction
+        # order does not depend on which thread finishes first
+        vector[double] partial_sums = vector[double](workers, 0)
         unsigned int tid
         Py_ssize_t istart, istop
 
+    # Row ``i`` is paired with the ``n - i - 1`` rows after it: the rows
+    # are split so that every worker gets the same number of pairs.
     for tid in range(workers):
-        istart = <Py_ssize_t> (n / workers * tid)
+        istart = <Py_ssize_t> (n * (1 - sqrt(1 - <double> tid / workers)))
         istop = <Py_ssize_t> (
-            n / workers * (tid + 1)) if tid < workers - 1 else n
+            n * (1 - sqrt(1 - <double> (tid + 1) / workers))
+        ) if tid < workers - 1 else n
+        # ``partial_sums[tid]`` would make Cython emit ``ref<double &>``,
+        # which does not compile: go through the raw pointer instead
         threads.push_back(
-            thread(one_thread_loop, loop_func, ref(disc2),
-                   sample_view, istart, istop, None)
+            thread(one_thread_loop, loop_func,
+                   ref(partial_sums.data()[tid]),
+                   sample_view, abs_view, istart, istop)
         )
 
     for tid in range(workers):
         threads[tid].join()
 
+    for tid in range(workers):
+        disc2 += partial_sums[tid]
+
     return disc2
 
 
 cdef void one_thread_loop(func_type loop_func,
                           double& disc,
                           double[:, ::1] sample_view,
+                          double[:, ::1] abs_view,
                           Py_ssize_t istart,
-                          Py_ssize_t istop,
-                          _) noexcept nogil:
-
-    cdef double tmp = loop_func(sample_view, istart, istop)
-
-    threaded_sum_mutex.lock()
-    (&disc)[0] += tmp # workaround to "disc += tmp", see cython issue #1863
-    threaded_sum_mutex.unlock()
+                          Py_ssize_t istop) noexcept nogil:
+    # workaround to "disc = ...", see cython issue #1863
+    (&disc)[0] = loop_func(sample_view, abs_view, istart, istop)
 
 
 def _cy_van_der_corput(Py_ssize_t n,
                        long base,
-                       long start_index,
+                       int64_t start_index,
                        unsigned int workers):
-    sequence = np.zeros(n, dtype=np.double)
+    sequence = np.empty(n, dtype=np.double)
 
     cdef:
         double[::1] sequence_view = sequence
@@ -370,33 +532,90 @@ def _cy_van_der_corput(Py_ssize_t n,
     return sequence
 
 
-cdef _cy_van_der_corput_threaded_loop(Py_ssize_t istart,
-                                      Py_ssize_t istop,
-                                      long base,
-                                      long start_index,
-                                      double[::1] sequence_view,
-                                      _):
-    cdef:
-        long quotient, remainder
-        Py_ssize_t i
-        double b2r
+cdef void _cy_van_der_corput_threaded_loop(Py_ssize_t istart,
+                                           Py_ssize_t istop,
+                                           long base,
+                                           int64_t start_index,
+                                           double[::1] sequence_view,
+                                           _) noexcept nogil:
+    cdef Py_ssize_t i
+
+    if base == 2:
+        for i in range(istart, istop):
+            sequence_view[i] = radical_inverse_base2(start_index + i)
+        return
 
     for i in range(istart, istop):
-        quotient = start_index + i
-        b2r = 1.0 / base
-        while quotient > 0:
-            remainder = quotient % base
-            sequence_view[i] += remainder * b2r
-            b2r /= base
-            quotient //= base
+        sequence_view[i] = radical_inverse(start_index + i, base)
+
+
+cdef inline unsigned long long reverse_bits(
+    unsigned long long x
+) noexcept nogil:
+    """Reverse the order of the 64 bits of `x` with masked shifts (SWAR)."""
+    cdef:
+        unsigned long long m1 = 0x5555555555555555ULL
+        unsigned long long m2 = 0x3333333333333333ULL
+        unsigned long long m4 = 0x0F0F0F0F0F0F0F0FULL
+        unsigned long long m8 = 0x00FF00FF00FF00FFULL
+        unsigned long long m16 = 0x0000FFFF0000FFFFULL
+
+    x = ((x >> 1) & m1) | ((x & m1) << 1)
+    x = ((x >> 2) & m2) | ((x & m2) << 2)
+    x = ((x >> 4) & m4) | ((x & m4) << 4)
+    x = ((x >> 8) & m8) | ((x & m8) << 8)
+    x = ((x >> 16) & m16) | ((x & m16) << 16)
+    return (x >> 32) | (x << 32)
+
+
+cdef inline double radical_inverse_base2(int64_t index) noexcept nogil:
+    # In base 2, the radical inverse of an index is its bit reversal:
+    # no loop over the digits is needed.
+    return <double> reverse_bits(<unsigned long long> index) * ldexp(1.0, -64)
+
+
+cdef inline double radical_inverse(int64_t index, long base) noexcept nogil:
+    cdef:
+        int64_t next_index
+        double b2r = 1.0 / base
+        double value = 0
+
+    while index > 0:
+        # the digit is derived from the quotient: a single integer
+        # division per digit
+        next_index = index // base
+        value += (index - next_index * base) * b2r
+        b2r /= base
+        index = next_index
+    return value
+
+
+cdef inline double scrambled_radical_inverse(int64_t index, long base,
+                                             const long* permutations,
+                                             Py_ssize_t n_digits
+                                             ) noexcept nogil:
+    # `permutations` is the C-contiguous (n_digits, base) table of the
+    # digit permutations
+    cdef:
+        Py_ssize_t j
+        int64_t next_index
+        double b2r = 1.0 / base
+        double value = 0
+
+    for j in range(n_digits):
+        next_index = index // base
+        value += permutations[j * base + index - next_index * base] * b2r
+        b2r /= base
+        index = next_index
+    return value
 
 
 def _cy_van_der_corput_scrambled(Py_ssize_t n,
                                  long base,
-                                 long start_index,
+                                 int64_t start_index,
                                  long[:,::1] permutations,
                                  unsigned int workers):
-    sequence = np.zeros(n)
+    sequence = np.empty(n)
 
     cdef:
         double[::1] sequence_view = sequence
@@ -424,23 +643,130 @@ def _cy_van_der_corput_scrambled(Py_ssize_t n,
     return sequence
 
 
-cdef _cy_van_der_corput_scrambled_loop(Py_ssize_t istart,
-                                       Py_ssize_t istop,
-                                       long base,
-                                       long start_index,
-                                       long[:,::1] permutations,
-                                       double[::1] sequence_view):
+cdef void _cy_van_der_corput_scrambled_loop(Py_ssize_t istart,
+                                            Py_ssize_t istop,
+                                            long base,
+                                            int64_t start_index,
+                                            long[:,::1] permutations,
+                                            double[::1] sequence_view
+                                            ) noexcept nogil:
+    cdef Py_ssize_t i
+
+    for i in range(istart, istop):
+        sequence_view[i] = scrambled_radical_inverse(
+            start_index + i, base, &permutations[0, 0], permutations.shape[0]
+        )
+
+
+def _cy_halton(Py_ssize_t n,
+               long[::1] bases,
+               int64_t start_index,
+               unsigned int workers):
+    sample = np.empty((n, bases.shape[0]))
 
     cdef:
-        long i, j, quotient, remainder
-        double b2r
+        double[:, ::1] sample_view = sample
+        vector[thread] threads
+        unsigned int tid
+        Py_ssize_t istart, istop
 
-    for i in range(istart, istop):
-        quotient = start_index + i
-        b2r = 1.0 / base
-        for j in range(permutations.shape[0]):
-            remainder = quotient % base
-            remainder = permutations[j, remainder]
-            sequence_view[i] += remainder * b2r
-            b2r /= base
-            quotient //= base
+    if workers <= 1:
+        _cy_halton_loop(0, n, bases, start_index, sample_view, None)
+        return sample
+
+    for tid in range(workers):
+        istart = <Py_ssize_t> (n / workers * tid)
+        istop = <Py_ssize_t> (
+                n / workers * (tid + 1)) if tid < workers - 1 else n
+        threads.push_back(
+            thread(_cy_halton_loop, istart, istop, bases,
+                   start_index, sample_view, None)
+        )
+
+    for tid in range(workers):
+        threads[tid].join()
+
+    return sample
+
+
+cdef void _cy_halton_loop(Py_ssize_t istart,
+                          Py_ssize_t istop,
+                          long[::1] bases,
+                          int64_t start_index,
+                          double[:, ::1] sample_view,
+                          _) noexcept nogil:
+    # All dimensions are filled in a single call: one Van der Corput
+    # sequence per column, each with its own base.
+    cdef:
+        long base
+        Py_ssize_t i, k
+
+    for k in range(bases.shape[0]):
+        base = bases[k]
+
+        if base == 2:
+            for i in range(istart, istop):
+                sample_view[i, k] = radical_inverse_base2(start_index + i)
+            continue
+
+        for i in range(istart, istop):
+            sample_view[i, k] = radical_inverse(start_index + i, base)
+
+
+def _cy_halton_scrambled(Py_ssize_t n,
+                         long[::1] bases,
+                         int64_t start_index,
+                         long[::1] permutations,
+                         Py_ssize_t[::1] offsets,
+                         unsigned int workers):
+    sample = np.empty((n, bases.shape[0]))
+
+    cdef:
+        double[:, ::1] sample_view = sample
+        vector[thread] threads
+        unsigned int tid
+        Py_ssize_t istart, istop
+
+    if workers <= 1:
+        _cy_halton_scrambled_loop(0, n, bases, start_index, permutations,
+                                  offsets, sample_view)
+        return sample
+
+    for tid in range(workers):
+        istart = <Py_ssize_t> (n / workers * tid)
+        istop = <Py_ssize_t> (
+                n / workers * (tid + 1)) if tid < workers - 1 else n
+        threads.push_back(
+            thread(_cy_halton_scrambled_loop, istart, istop, bases,
+                   start_index, permutations, offsets, sample_view)
+        )
+
+    for tid in range(workers):
+        threads[tid].join()
+
+    return sample
+
+
+cdef void _cy_halton_scrambled_loop(Py_ssize_t istart,
+                                    Py_ssize_t istop,
+                                    long[::1] bases,
+                                    int64_t start_index,
+                                    long[::1] permutations,
+                                    Py_ssize_t[::1] offsets,
+                                    double[:, ::1] sample_view
+                                    ) noexcept nogil:
+    # The permutations of all dimensions are stored one after the other:
+    # the (n_digits, base) table of dimension `k` starts at `offsets[k]`.
+    cdef:
+        long base
+        Py_ssize_t i, k, offset, n_digits
+
+    for k in range(bases.shape[0]):
+        base = bases[k]
+        offset = offsets[k]
+        n_digits = (offsets[k + 1] - offset) // base
+
+        for i in range(istart, istop):
+            sample_view[i, k] = scrambled_radical_inverse(
+                start_index + i, base, &permutations[offset], n_digits
+            )
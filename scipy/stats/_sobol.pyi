@@ -38,17 +38,5 @@ def _fast_forward(
     quasi: np.ndarray
     ) -> None: ...
 
-def _categorize(
-    draws: np.ndarray,
-    p_cumulative: np.ndarray,
-    result: np.ndarray
-    ) -> None: ...
-
 _MAXDIM: Literal[21201]
 _MAXDEG: Literal[18]
-
-def _test_find_index(
-    p_cumulative: np.ndarray, 
-    size: int, 
-    value: float
-    ) -> int: ...
@@ -357,6 +357,19 @@ cdef uint_32_64 cdot_pow2(uint_32_64[::1] a) noexcept nogil:
     return z
 
 
+@cython.boundscheck(False)
+@cython.wraparound(False)
+cdef inline int parity(unsigned long long x) noexcept nogil:
+    """Parity of the number of set bits of an integer."""
+    x ^= x >> 32
+    x ^= x >> 16
+    x ^= x >> 8
+    x ^= x >> 4
+    x ^= x >> 2
+    x ^= x >> 1
+    return <int> (x & 1)
+
+
 @cython.boundscheck(False)
 @cython.wraparound(False)
 cpdef void _cscramble(const int dim,
@@ -364,8 +377,10 @@ cpdef void _cscramble(const int dim,
                       uint_32_64[:, :, ::1] ltm,
                       uint_32_64[:, ::1] sv) noexcept nogil:
     """Scrambling using (left) linear matrix scramble (LMS)."""
-    cdef int d, i, j, k, p
-    cdef uint_32_64 l, lsmdp, t1, t2, vdj
+    cdef int d, i, j, p
+    cdef uint_32_64 l, t2, vdj
+    # rows of the lower triangular matrix packed as integers, bits <= 64
+    cdef uint_32_64 lsm[64]
 
     # Set diagonals of bits x bits arrays to 1
     for d in range(dim):
@@ -373,17 +388,17 @@ cpdef void _cscramble(const int dim,
             ltm[d, i, i] = 1
 
     for d in range(dim):
+        # each row is packed once and reused for all direction numbers
+        for p in range(bits):
+            lsm[p] = cdot_pow2(ltm[d, p, :])
+
         for j in range(bits):
             vdj = sv[d, j]
             l = 1
             t2 = 0
             for p in range(bits - 1, -1, -1):
-                lsmdp = cdot_pow2(ltm[d, p, :])
-                t1 = 0
-                for k in range(bits):
-                    t1 += ibits(lsmdp, k, 1) * ibits(vdj, k, 1)
-                t1 = t1 % 2
-                t2 = t2 + t1 * l
+                # dot product modulo 2 of the bits of the row and of vdj
+                t2 = t2 + parity(lsm[p] & vdj) * l
                 l = 2 * l
             sv[d, j] = t2
 
@@ -400,38 +415,3 @@ cpdef void _fill_p_cumulative(cnp.float_t[::1] p,
         t = tot + p[i]
         p_cumulative[i] = t
         tot = t
-
-
-@cython.boundscheck(False)
-@cython.wraparound(False)
-cpdef void _categorize(cnp.float_t[::1] draws,
-                       cnp.float_t[::1] p_cumulative,
-                       cnp.int_t[::1] result) noexcept nogil:
-    cdef int i
-    cdef int n_p = p_cumulative.shape[0]
-    for i in range(draws.shape[0]):
-        j = _find_index(p_cumulative, n_p, draws[i])
-        result[j] = result[j] + 1
-
-
-@cython.boundscheck(False)
-@cython.wraparound(False)
-cdef int _find_index(cnp.float_t[::1] p_cumulative,
-                     const int size,
-                     const float value) noexcept nogil:
-    cdef int l = 0
-    cdef int r = size - 1
-    cdef int m
-    while r > l:
-        m = (l + r) // 2
-        if value > p_cumulative[m]:
-            l = m + 1
-        else:
-            r = m
-    return r
-
-
-def _test_find_index(p_cumulative, size, value):
-    # type: (np.ndarray, int, float) -> int
-    """Wrapper for testing in python"""
-    return _find_index(p_cumulative, size, value)
@@ -1,3 +1,4 @@
+import math
 import os
 from collections import Counter
 from itertools import combinations, product
@@ -8,12 +9,12 @@ from numpy.testing import assert_allclose, assert_equal, assert_array_equal
 
 from scipy.spatial import distance
 from scipy.stats import shapiro
-from scipy.stats._sobol import _test_find_index
 from scipy.stats import qmc
 from scipy.stats._qmc import (
     van_der_corput, n_primes, primes_from_2_to,
     update_discrepancy, QMCEngine, _l1_norm,
-    _perturb_discrepancy, _lloyd_centroidal_voronoi_tessellation
+    _perturb_discrepancy, _lloyd_centroidal_voronoi_tessellation,
+    _van_der_corput_permutations, _shuffle_rows
 )  # noqa
 
 
@@ -326,6 +327,24 @@ class TestUtils:
         out = [2, 3, 5, 7, 11, 13, 17, 19, 23, 29, 31, 37, 41, 43, 47]
         assert_allclose(primes, out)
 
+    @pytest.mark.parametrize("rng_type", [np.random.default_rng,
+                                          np.random.RandomState])
+    def test_shuffle_rows(self, rng_type):
+        # one call for all rows consumes the stream as one shuffle per row
+        seed = 3209175
+        x = np.tile(np.arange(11), (7, 1))
+        rng = rng_type(seed)
+        _shuffle_rows(x, rng)
+
+        rng_ref = rng_type(seed)
+        ref = np.tile(np.arange(11), (7, 1))
+        for row in ref:
+            rng_ref.shuffle(row)
+        assert_array_equal(x, ref)
+
+        # the stream is left in the same state
+        assert rng.random() == rng_ref.random()
+
 
 class TestVDC:
     def test_van_der_corput(self):
@@ -343,6 +362,25 @@ class TestVDC:
         sample = van_der_corput(7, start_index=3)
         assert_allclose(sample, out[3:])
 
+    @pytest.mark.parametrize("base", [2, 3])
+    @pytest.mark.parametrize("workers", [1, 4])
+    def test_van_der_corput_large_index(self, base, workers):
+        # indices beyond 32 bits, the bit reversal of base 2 matches the
+        # generic digit expansion
+        def radical_inverse(index, base):
+            value, b2r = 0.0, 1.0 / base
+            while index > 0:
+                index, digit = divmod(index, base)
+                value += digit * b2r
+                b2r /= base
+            return value
+
+        start_index = 2**40
+        ref = [radical_inverse(start_index + i, base) for i in range(10)]
+        sample = van_der_corput(10, base=base, start_index=start_index,
+                                workers=workers)
+        assert_allclose(sample, ref, rtol=1e-15)
+
     def test_van_der_corput_scramble(self):
         seed = 338213789010180879520345496831675783177
         out = van_der_corput(10, scramble=True, seed=seed)
@@ -360,6 +398,23 @@ class TestVDC:
         )
         assert_allclose(sample, out[3:])
 
+    @pytest.mark.parametrize("rng_type", [np.random.default_rng,
+                                          np.random.RandomState])
+    def test_van_der_corput_permutations(self, rng_type):
+        # one call for all rows consumes the stream as one shuffle per row
+        seed = 2841720
+        rng = rng_type(seed)
+        permutations = _van_der_corput_permutations(5, random_state=rng)
+
+        rng_ref = rng_type(seed)
+        ref = np.tile(np.arange(5), (permutations.shape[0], 1))
+        for row in ref:
+            rng_ref.shuffle(row)
+        assert_array_equal(permutations, ref)
+
+        # the stream is left in the same state
+        assert rng.random() == rng_ref.random()
+
     def test_invalid_base_error(self):
         with pytest.raises(ValueError, match=r"'base' must be at least 2"):
             van_der_corput(10, base=1)
@@ -616,6 +671,15 @@ class QMCEngineTests:
 
         assert metric_ < metric_ref
 
+    def test_reset_optimizer(self):
+        engine = self.engine(d=2, scramble=False, optimization="random-CD",
+                             seed=170382760648021597650530316304495310428)
+        ref_sample = engine.random(n=8)
+
+        engine.reset()
+        sample = engine.random(n=8)
+        assert_allclose(sample, ref_sample)
+
     def test_consume_prng_state(self):
         rng = np.random.default_rng(0xa29cabb11cfdf44ff6cac8bec254c2a0)
         sample = []
@@ -647,6 +711,25 @@ class TestHalton(QMCEngineTests):
                             [0.87746036, 0.71160259],
                             [0.37746036, 0.04493592]])
 
+    def test_scramble_random_state(self):
+        # the permutations of a legacy RandomState are shuffled row by row
+        seed = 1350772
+        n = 16
+        engine = self.engine(d=3, scramble=True,
+                             seed=np.random.RandomState(seed))
+        sample = engine.random(n)
+
+        rng = np.random.RandomState(seed)
+        ref = np.empty((n, 3))
+        for i, base in enumerate([2, 3, 5]):
+            count = math.ceil(54 / math.log2(base)) - 1
+            permutations = np.tile(np.arange(base), (count, 1))
+            for row in permutations:
+                rng.shuffle(row)
+            ref[:, i] = van_der_corput(n, base, scramble=True,
+                                       permutations=permutations)
+        assert_allclose(sample, ref)
+
     def test_workers(self):
         ref_sample = self.reference(scramble=True)
         engine = self.engine(d=2, scramble=True)
@@ -726,6 +809,31 @@ class TestLHS(QMCEngineTests):
 
         assert_array_equal(sample_ref, sample_)
 
+    def test_random_state(self):
+        # the permutations of a legacy RandomState are shuffled row by row
+        seed = 2097014
+        n, d = 16, 3
+        engine = self.engine(d=d, scramble=True,
+                             seed=np.random.RandomState(seed))
+        sample = engine.random(n)
+
+        rng = np.random.RandomState(seed)
+        samples = rng.uniform(size=(n, d))
+        perms = np.tile(np.arange(1, n + 1), (d, 1))
+        for row in perms:
+            rng.shuffle(row)
+        assert_allclose(sample, (perms.T - samples) / n)
+
+        # the OA-LHS of strength 2 draws its permutations in the same way
+        engine = self.engine(d=d, scramble=True, strength=2,
+                             seed=np.random.RandomState(seed))
+        sample = engine.random(25)
+        engine = self.engine(d=d, scramble=True, strength=2,
+                             seed=np.random.RandomState(seed))
+        assert_array_equal(engine.random(25), sample)
+        assert_array_equal(np.sort(np.floor(sample * 25), axis=0),
+                           np.tile(np.arange(25), (d, 1)).T)
+
     def test_raises(self):
         message = r"not a valid strength"
         with pytest.raises(ValueError, match=message):
@@ -821,6 +929,35 @@ class TestSobol(QMCEngineTests):
         sample = engine.random(8)
         assert_array_equal(self.unscramble_nd, sample)
 
+    def test_first_point_copy(self):
+        # the first draw is a copy: modifying it does not change the engine
+        engine = qmc.Sobol(2, seed=86271359421049312763051870145929153012)
+        first_point = engine._first_point.copy()
+        sample = engine.random(1)
+        assert not np.shares_memory(sample, engine._first_point)
+        assert_array_equal(sample, first_point)
+
+        sample[...] = -1
+        assert_array_equal(engine._first_point, first_point)
+
+        engine.reset()
+        assert_array_equal(engine.random(1), first_point)
+
+    @pytest.mark.parametrize("bits", [30, 64])
+    def test_scramble_blocks(self, bits, monkeypatch):
+        # scrambling by blocks of dimensions draws the same random stream
+        # as a single block
+        seed = 179243614390218730112547190251106372101
+        d = 300
+        engine = qmc.Sobol(d, bits=bits, seed=seed)
+        sample = engine.random(8)
+
+        monkeypatch.setattr("scipy.stats._qmc._SCRAMBLE_BLOCK_SIZE", d)
+        engine_ = qmc.Sobol(d, bits=bits, seed=seed)
+        assert_array_equal(engine_._shift, engine._shift)
+        assert_array_equal(engine_._sv, engine._sv)
+        assert_array_equal(engine_.random(8), sample)
+
 
 class TestPoisson(QMCEngineTests):
     qmce = qmc.PoissonDisk
@@ -930,15 +1067,6 @@ class TestMultinomialQMC:
         draws = engine.random(1)
         assert_allclose(draws / np.sum(draws), np.atleast_2d(p), atol=1e-4)
 
-    def test_FindIndex(self):
-        p_cumulative = np.array([0.1, 0.4, 0.45, 0.6, 0.75, 0.9, 0.99, 1.0])
-        size = len(p_cumulative)
-        assert_equal(_test_find_index(p_cumulative, size, 0.0), 0)
-        assert_equal(_test_find_index(p_cumulative, size, 0.4), 2)
-        assert_equal(_test_find_index(p_cumulative, size, 0.44999), 2)
-        assert_equal(_test_find_index(p_cumulative, size, 0.45001), 3)
-        assert_equal(_test_find_index(p_cumulative, size, 1.0), size - 1)
-
     @pytest.mark.filterwarnings('ignore::UserWarning')
     def test_other_engine(self):
         # same as test_MultinomialBasicDraw with different engine